@@ -4,17 +4,38 @@ Uses SQLite for simplicity.
 """
 
 import sqlite3
+from functools import lru_cache
 from pathlib import Path
 
 DB_PATH = Path(__file__).parent / "db" / "olympics.db"
 
+STATS_TABLES = ["countries", "sports", "competitions", "athletes", "entries", "excluded_athletes"]
 
+# Row counts for every table in one statement
+_COUNTS_SQL = " UNION ALL ".join(
+    f"SELECT '{table}', COUNT(*) FROM {table}" for table in STATS_TABLES
+)
+
+
+@lru_cache(maxsize=1)
 def get_connection():
-    """Get database connection."""
+    """
+    Get the shared database connection.
+    
+    The connection is opened once per process and reused, so callers should
+    not close it; entry points release it with close_connection() when done.
+    """
     DB_PATH.parent.mkdir(exist_ok=True)
     return sqlite3.connect(DB_PATH)
 
 
+def close_connection():
+    """Close the shared connection; the next get_connection() reopens it."""
+    if get_connection.cache_info().currsize:
+        get_connection().close()
+        get_connection.cache_clear()
+
+
 def init_db():
     """Initialize database with schema."""
     conn = get_connection()
@@ -72,6 +93,12 @@ def init_db():
         )
     """)
     
+    # Per-source deletes (clear_entries_by_source, the ISU manual-entry purge)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_entries_source_comp
+        ON entries(source, competition_id)
+    """)
+    
     # Excluded athletes
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS excluded_athletes (
@@ -82,7 +109,6 @@ def init_db():
     """)
     
     conn.commit()
-    conn.close()
     print(f"Database initialized at {DB_PATH}")
 
 
@@ -93,7 +119,6 @@ def clear_entries_by_source(source: str):
     cursor.execute("DELETE FROM entries WHERE source = ?", (source,))
     deleted = cursor.rowcount
     conn.commit()
-    conn.close()
     return deleted
 
 
@@ -102,16 +127,13 @@ def get_stats():
     conn = get_connection()
     cursor = conn.cursor()
     
-    stats = {}
-    for table in ["countries", "sports", "competitions", "athletes", "entries", "excluded_athletes"]:
-        cursor.execute(f"SELECT COUNT(*) FROM {table}")
-        stats[table] = cursor.fetchone()[0]
+    cursor.execute(_COUNTS_SQL)
+    stats = dict(cursor.fetchall())
     
     # Entries by source
     cursor.execute("SELECT source, COUNT(*) FROM entries GROUP BY source")
     stats["entries_by_source"] = dict(cursor.fetchall())
     
-    conn.close()
     return stats
 
 
@@ -23,10 +23,13 @@ EXCLUDED_ATHLETES = [
     ("Ireen Wüst", "NED", "retired"),
 ]
 
+# (name, country) lookup set, built once at import
+EXCLUDED_SET = frozenset((name, country) for name, country, _ in EXCLUDED_ATHLETES)
+
 
 def get_excluded_set():
     """Return set of (name, country) tuples for quick lookup."""
-    return {(name, country) for name, country, _ in EXCLUDED_ATHLETES}
+    return EXCLUDED_SET
 
 
 def get_excluded_with_reasons():
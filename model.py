@@ -15,8 +15,11 @@ without Monte Carlo simulation!
 
 from dataclasses import dataclass
 from typing import List, Dict, Tuple
+from operator import attrgetter
 import math
 
+import numpy as np
+
 
 @dataclass
 class AthleteStrength:
@@ -107,6 +110,7 @@ class PlackettLuceModel:
         Calculate exact gold/silver/bronze probabilities for all athletes.
         
         Uses Plackett-Luce closed-form expressions.
+        Predictions are returned in the same order as `athletes`.
         """
         if len(athletes) < 3:
             return []
@@ -114,30 +118,28 @@ class PlackettLuceModel:
         # Ensure strengths are calculated
         athletes = self.calculate_strengths(athletes)
         
-        n = len(athletes)
-        strengths = [a.strength for a in athletes]
-        total_strength = sum(strengths)
+        strengths = np.array([a.strength for a in athletes], dtype=np.float64)
+        gold, silver, bronze = plackett_luce_probabilities(strengths)
         
         predictions = []
         
         for i, athlete in enumerate(athletes):
-            gold_prob = self._gold_probability(strengths, i)
-            silver_prob = self._silver_probability(strengths, i)
-            bronze_prob = self._bronze_probability(strengths, i)
-            
             predictions.append(AthletePrediction(
                 athlete_id=athlete.athlete_id,
                 name=athlete.name,
                 country=athlete.country,
                 score=athlete.score,
                 strength=athlete.strength,
-                gold_prob=gold_prob,
-                silver_prob=silver_prob,
-                bronze_prob=bronze_prob
+                gold_prob=float(gold[i]),
+                silver_prob=float(silver[i]),
+                bronze_prob=float(bronze[i])
             ))
         
         return predictions
     
+    # Per-athlete reference forms of the formulas that
+    # plackett_luce_probabilities evaluates for the whole field at once.
+    
     def _gold_probability(self, strengths: List[float], athlete_idx: int) -> float:
         """
         P(athlete i wins) = strength_i / sum(strengths)
@@ -243,6 +245,50 @@ class PlackettLuceModel:
 # UTILITY FUNCTIONS
 # ============================================================
 
+def plackett_luce_probabilities(strengths: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Exact gold/silver/bronze probabilities for every athlete at once.
+    
+    Evaluates the same closed forms as the per-athlete methods above, but
+    shares the sums between athletes instead of redoing them per athlete:
+        silver_i = s_i * (sum_k g_k / (S - s_k)  -  g_i / (S - s_i))
+        T[k, j]  = P(k wins, j second) / (S - s_k - s_j)
+        bronze_i = s_i * (sum(T) - sum(T[i, :]) - sum(T[:, i]))
+    where g = s / S. That is O(N^2) work instead of the O(N^3) double
+    sum per athlete.
+    
+    Args:
+        strengths: 1-D array of positive strengths
+    
+    Returns:
+        (gold, silver, bronze) arrays aligned with strengths
+    """
+    n = len(strengths)
+    idx = np.arange(n)
+    S = strengths.sum()
+    rest = S - strengths  # total strength left after each athlete wins
+    
+    gold = strengths / S
+    
+    # P(i second) = s_i * sum over winners k != i of g_k / (S - s_k)
+    win_ratio = gold / rest
+    silver = strengths * (win_ratio.sum() - win_ratio)
+    
+    # T[k, j] = g_k * s_j / (S - s_k) / (S - s_k - s_j), zero for k == j
+    remaining = rest[:, None] - strengths[None, :]
+    remaining[idx, idx] = 1.0  # k == j never happens; avoid dividing by 0
+    T = win_ratio[:, None] * strengths[None, :] / remaining
+    T[idx, idx] = 0.0
+    bronze = strengths * (T.sum() - T.sum(axis=1) - T.sum(axis=0))
+    
+    # The subtractions can leave rounding-level negatives (~1e-12) for a
+    # dominant athlete's near-zero silver/bronze chance
+    np.maximum(silver, 0.0, out=silver)
+    np.maximum(bronze, 0.0, out=bronze)
+    
+    return gold, silver, bronze
+
+
 def create_athletes_from_scores(data: List[Dict]) -> List[AthleteStrength]:
     """
     Create AthleteStrength list from simple dict data.
@@ -309,7 +355,7 @@ if __name__ == "__main__":
         print(f"\n{'Athlete':<25}{'Score':>8}{'Strength':>10}{'P(G)':>10}{'P(S)':>10}{'P(B)':>10}{'P(Medal)':>10}")
         print("-" * 85)
         
-        for p in sorted(predictions, key=lambda x: -x.gold_prob):
+        for p in sorted(predictions, key=attrgetter("gold_prob"), reverse=True):
             print(f"{p.name:<25}{p.score:>8.0f}{p.strength:>10.3f}"
                   f"{p.gold_prob*100:>9.1f}%{p.silver_prob*100:>9.1f}%"
                   f"{p.bronze_prob*100:>9.1f}%{p.medal_prob*100:>9.1f}%")
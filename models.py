@@ -8,6 +8,7 @@ Uses dataclasses for clear, typed data structures.
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 import csv
+from operator import attrgetter
 from pathlib import Path
 
 
@@ -45,19 +46,23 @@ class AthleteCompetitionResult:
         """Probability of any medal."""
         return self.gold_prob + self.silver_prob + self.bronze_prob
     
-    def to_dict(self) -> dict:
-        return {
-            "athlete_id": self.athlete_id,
-            "athlete_name": self.athlete_name,
-            "country": self.country,
-            "score": self.score,
-            "relative_score": round(self.relative_score, 3),
-            "strength": round(self.strength, 4),
-            "gold_prob": round(self.gold_prob, 4),
-            "silver_prob": round(self.silver_prob, 4),
-            "bronze_prob": round(self.bronze_prob, 4),
-            "medal_prob": round(self.medal_prob, 4)
-        }
+    # Column order of to_row()
+    CSV_FIELDS = ("athlete_name", "country", "score", "relative_score", "strength",
+                  "gold_prob", "silver_prob", "bronze_prob", "medal_prob")
+    
+    def to_row(self) -> tuple:
+        """CSV row in CSV_FIELDS order."""
+        return (
+            self.athlete_name,
+            self.country,
+            self.score,
+            round(self.relative_score, 3),
+            round(self.strength, 4),
+            round(self.gold_prob, 4),
+            round(self.silver_prob, 4),
+            round(self.bronze_prob, 4),
+            round(self.medal_prob, 4)
+        )
 
 
 @dataclass
@@ -71,7 +76,7 @@ class CompetitionResult:
     
     def get_top_athletes(self, n: int = 5) -> List[AthleteCompetitionResult]:
         """Get top N athletes by gold probability."""
-        return sorted(self.athlete_results, key=lambda x: -x.gold_prob)[:n]
+        return sorted(self.athlete_results, key=attrgetter("gold_prob"), reverse=True)[:n]
     
     def get_country_breakdown(self) -> Dict[str, dict]:
         """Aggregate results by country for this competition."""
@@ -119,19 +124,24 @@ class CountryCompetitionBreakdown:
     def expected_total(self) -> float:
         return self.expected_gold + self.expected_silver + self.expected_bronze
     
-    def to_dict(self) -> dict:
-        return {
-            "country": self.country,
-            "sport": self.sport,
-            "competition": self.competition,
-            "competition_id": self.competition_id,
-            "expected_gold": round(self.expected_gold, 3),
-            "expected_silver": round(self.expected_silver, 3),
-            "expected_bronze": round(self.expected_bronze, 3),
-            "expected_total": round(self.expected_total, 3),
-            "top_athlete": self.top_athlete,
-            "top_athlete_gold_prob": round(self.top_athlete_gold_prob, 3)
-        }
+    # Column order of to_row()
+    CSV_FIELDS = ("country", "sport", "competition", "expected_gold",
+                  "expected_silver", "expected_bronze", "expected_total",
+                  "top_athlete", "top_athlete_gold_prob")
+    
+    def to_row(self) -> tuple:
+        """CSV row in CSV_FIELDS order."""
+        return (
+            self.country,
+            self.sport,
+            self.competition,
+            round(self.expected_gold, 3),
+            round(self.expected_silver, 3),
+            round(self.expected_bronze, 3),
+            round(self.expected_total, 3),
+            self.top_athlete,
+            round(self.top_athlete_gold_prob, 3)
+        )
 
 
 @dataclass
@@ -158,7 +168,7 @@ class CountrySummary:
     
     def get_top_competitions(self, n: int = 10) -> List[CountryCompetitionBreakdown]:
         """Get top N competitions by expected medals."""
-        return sorted(self.competition_breakdown, key=lambda x: -x.expected_total)[:n]
+        return sorted(self.competition_breakdown, key=attrgetter("expected_total"), reverse=True)[:n]
 
 
 # ============================================================
@@ -197,7 +207,7 @@ class SimulationOutput:
     
     def get_top_countries(self, n: int = 10) -> List[CountrySummary]:
         """Get top N countries by total medals."""
-        return sorted(self.country_summaries, key=lambda x: -x.total)[:n]
+        return sorted(self.country_summaries, key=attrgetter("total"), reverse=True)[:n]
     
     # --------------------------------------------------------
     # EXPORT METHODS
@@ -214,7 +224,7 @@ class SimulationOutput:
     
     def save_country_summary(self, filepath: Path):
         """Save country summary to CSV."""
-        sorted_countries = sorted(self.country_summaries, key=lambda x: -x.total)
+        sorted_countries = sorted(self.country_summaries, key=attrgetter("total"), reverse=True)
         
         with open(filepath, "w", newline="") as f:
             writer = csv.DictWriter(f, fieldnames=["country", "gold", "silver", "bronze", "total"])
@@ -226,77 +236,60 @@ class SimulationOutput:
     
     def save_country_competition_breakdown(self, filepath: Path):
         """Save country-competition breakdown to CSV."""
-        all_breakdown = []
-        
-        for country in self.country_summaries:
-            for comp in country.competition_breakdown:
-                if comp.expected_total >= 0.01:  # Skip negligible
-                    all_breakdown.append(comp.to_dict())
+        fieldnames = CountryCompetitionBreakdown.CSV_FIELDS
+        all_breakdown = [
+            comp.to_row()
+            for country in self.country_summaries
+            for comp in country.competition_breakdown
+            if comp.expected_total >= 0.01  # Skip negligible
+        ]
         
         # Sort by expected total descending
-        all_breakdown.sort(key=lambda x: (-x["expected_total"], x["country"]))
-        
-        fieldnames = ["country", "sport", "competition", "expected_gold", 
-                     "expected_silver", "expected_bronze", "expected_total",
-                     "top_athlete", "top_athlete_gold_prob"]
+        total = fieldnames.index("expected_total")
+        all_breakdown.sort(key=lambda row: (-row[total], row[0]))
         
         with open(filepath, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
             writer.writerows(all_breakdown)
         
         print(f"Saved: {filepath}")
     
     def save_competition_details(self, filepath: Path):
         """Save full competition details to CSV."""
-        all_details = []
-        
-        for comp in self.competition_results:
-            for athlete in comp.athlete_results:
-                row = athlete.to_dict()
-                row["competition"] = comp.competition_name
-                row["competition_id"] = comp.competition_id
-                row["sport"] = comp.sport
-                all_details.append(row)
+        fieldnames = ("competition", "sport") + AthleteCompetitionResult.CSV_FIELDS
+        all_details = [
+            (comp.competition_name, comp.sport) + athlete.to_row()
+            for comp in self.competition_results
+            for athlete in comp.athlete_results
+        ]
         
         # Sort by competition, then gold_prob descending
-        all_details.sort(key=lambda x: (x["competition"], -x["gold_prob"]))
-        
-        fieldnames = ["competition", "sport", "athlete_name", "country", "score",
-                     "relative_score", "strength", "gold_prob", "silver_prob",
-                     "bronze_prob", "medal_prob"]
+        gold = fieldnames.index("gold_prob")
+        all_details.sort(key=lambda row: (row[0], -row[gold]))
         
         with open(filepath, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
             writer.writerows(all_details)
         
         print(f"Saved: {filepath}")
     
     def save_competition_predictions(self, filepath: Path):
         """Save competition predictions (legacy format for Streamlit compatibility)."""
-        all_predictions = []
-        
-        for comp in self.competition_results:
-            for athlete in comp.athlete_results:
-                all_predictions.append({
-                    "competition": comp.competition_name,
-                    "athlete_id": athlete.athlete_id,
-                    "athlete_name": athlete.athlete_name,
-                    "country": athlete.country,
-                    "gold_prob": round(athlete.gold_prob, 4),
-                    "silver_prob": round(athlete.silver_prob, 4),
-                    "bronze_prob": round(athlete.bronze_prob, 4),
-                    "medal_prob": round(athlete.medal_prob, 4)
-                })
-        
         with open(filepath, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=[
+            writer = csv.writer(f)
+            writer.writerow([
                 "competition", "athlete_id", "athlete_name", "country",
                 "gold_prob", "silver_prob", "bronze_prob", "medal_prob"
             ])
-            writer.writeheader()
-            writer.writerows(all_predictions)
+            writer.writerows(
+                (comp.competition_name, athlete.athlete_id, athlete.athlete_name,
+                 athlete.country, round(athlete.gold_prob, 4), round(athlete.silver_prob, 4),
+                 round(athlete.bronze_prob, 4), round(athlete.medal_prob, 4))
+                for comp in self.competition_results
+                for athlete in comp.athlete_results
+            )
         
         print(f"Saved: {filepath}")
     
@@ -316,13 +309,15 @@ class SimulationOutput:
         print(f"\n{'Rank':<6}{'Country':<10}{'Gold':>8}{'Silver':>8}{'Bronze':>8}{'Total':>8}")
         print("-" * 50)
         
-        for i, c in enumerate(self.get_top_countries(10), 1):
+        # Sorted once; the breakdown below reuses the leader
+        top_countries = self.get_top_countries(10)
+        for i, c in enumerate(top_countries, 1):
             print(f"{i:<6}{c.country:<10}{c.gold:>8.1f}{c.silver:>8.1f}"
                   f"{c.bronze:>8.1f}{c.total:>8.1f}")
         
         # Top country breakdown
-        if self.country_summaries:
-            top_country = self.get_top_countries(1)[0]
+        if top_countries:
+            top_country = top_countries[0]
             print(f"\n{'=' * 70}")
             print(f"BREAKDOWN: {top_country.country}")
             print(f"{'=' * 70}")
@@ -341,8 +336,9 @@ class SimulationOutput:
         print("NORDIC COUNTRIES")
         print("=" * 70)
         
+        by_code = {c.country: c for c in self.country_summaries}
         for code in ["NOR", "SWE", "FIN", "DEN"]:
-            country = self.get_country(code)
+            country = by_code.get(code)
             if country:
                 print(f"{code}: {country.total:.1f} medals "
                       f"(G:{country.gold:.1f} S:{country.silver:.1f} B:{country.bronze:.1f})")
@@ -11,6 +11,7 @@ Source: https://www.fis-ski.com/DB/alpine-skiing/cup-standings.html
 import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 import sys
 
@@ -32,16 +33,20 @@ HEADERS = {
 }
 
 
+# Athlete ID cleanup in one pass: spaces become hyphens, dots/commas are dropped
+_ID_TRANS = str.maketrans({" ": "-", ".": None, ",": None})
+
+
 def create_athlete_id(name: str, country: str) -> str:
     """Create a consistent athlete ID."""
-    clean_name = name.lower().replace(" ", "-").replace(".", "").replace(",", "")
+    clean_name = name.lower().translate(_ID_TRANS)
     return f"{clean_name}-{country.lower()}"
 
 
-def fetch_discipline_standings(discipline: str, gender: str, season: str = "2025"):
+def fetch_discipline_standings(discipline: str, gender: str, season: str = "2025", log=print):
     """
     Fetch World Cup standings for a specific discipline.
-    Returns list of {name, country, rank, points}
+    Returns list of {name, country, rank, points}; errors go to log (default: print).
     """
     params = {
         "sectorcode": "AL",
@@ -115,21 +120,42 @@ def fetch_discipline_standings(discipline: str, gender: str, season: str = "2025
                 })
         
         # Sort by rank
-        athletes.sort(key=lambda x: x["rank"])
+        athletes.sort(key=itemgetter("rank"))
         
         return athletes
         
     except requests.RequestException as e:
-        print(f"    Error fetching {discipline} {gender}: {e}")
+        log(f"    Error fetching {discipline} {gender}: {e}")
         return []
 
 
-def import_fis_alpine_data():
-    """Import FIS alpine skiing data into the database."""
+def fetch_all_standings(log=print):
+    """Fetch standings for every discipline; returns {(discipline, gender): athletes}."""
+    return {
+        (discipline, gender): fetch_discipline_standings(discipline, gender, log=log)
+        for discipline, events in DISCIPLINES.items()
+        for gender in events
+    }
+
+
+def import_fis_alpine_data(fetch=None):
+    """
+    Import FIS alpine skiing data into the database.
+    
+    Args:
+        fetch: Callable returning prefetched fetch_all_standings() output,
+               called after the banner (see run_pipeline.run_all); each
+               discipline is fetched in turn if None
+    """
     print("=" * 60)
     print("FIS ALPINE SKIING PIPELINE")
     print("=" * 60)
     
+    standings = fetch() if fetch is not None else None
+    if standings is not None and not any(standings.values()):
+        print("\n⚠ No standings fetched (scraping failed).")
+        return False
+    
     conn = get_connection()
     cursor = conn.cursor()
     
@@ -152,9 +178,12 @@ def import_fis_alpine_data():
     for discipline, events in DISCIPLINES.items():
         for gender, comp_id in events.items():
             gender_name = "Men" if gender == "M" else "Women"
-            print(f"\n  Fetching {discipline} {gender_name}...")
-            
-            athletes = fetch_discipline_standings(discipline, gender)
+            if standings is None:
+                print(f"\n  Fetching {discipline} {gender_name}...")
+                athletes = fetch_discipline_standings(discipline, gender)
+            else:
+                print(f"\n  {discipline} {gender_name}:")
+                athletes = standings[(discipline, gender)]
             
             if not athletes:
                 print(f"    No data found")
@@ -189,7 +218,6 @@ def import_fis_alpine_data():
                 print(f"      {a['rank']}. {a['name']} ({a['country']}): {a['points']} pts")
     
     conn.commit()
-    conn.close()
     
     print(f"\n✓ FIS Alpine import complete!")
     print(f"  New athletes: {athletes_added}")
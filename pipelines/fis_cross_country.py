@@ -10,6 +10,7 @@ Source: https://www.fis-ski.com/DB/cross-country/cup-standings.html
 import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 import re
 import sys
@@ -54,16 +55,20 @@ HEADERS = {
 }
 
 
+# Athlete ID cleanup in one pass: spaces become hyphens, dots/commas are dropped
+_ID_TRANS = str.maketrans({" ": "-", ".": None, ",": None})
+
+
 def create_athlete_id(name: str, country: str) -> str:
     """Create a consistent athlete ID."""
-    clean_name = name.lower().replace(" ", "-").replace(".", "").replace(",", "")
+    clean_name = name.lower().translate(_ID_TRANS)
     return f"{clean_name}-{country.lower()}"
 
 
-def fetch_discipline_standings(discipline: str, gender: str, season: str = "2025"):
+def fetch_discipline_standings(discipline: str, gender: str, season: str = "2025", log=print):
     """
     Fetch World Cup standings for a specific discipline (SP or DI).
-    Returns list of {name, country, rank, points}
+    Returns list of {name, country, rank, points}; errors go to log (default: print).
     """
     params = {
         "sectorcode": "CC",
@@ -137,21 +142,42 @@ def fetch_discipline_standings(discipline: str, gender: str, season: str = "2025
                 })
         
         # Sort by rank
-        athletes.sort(key=lambda x: x["rank"])
+        athletes.sort(key=itemgetter("rank"))
         
         return athletes
         
     except requests.RequestException as e:
-        print(f"    Error fetching {discipline} {gender}: {e}")
+        log(f"    Error fetching {discipline} {gender}: {e}")
         return []
 
 
-def import_fis_cross_country_data():
-    """Import FIS cross-country skiing data into the database."""
+def fetch_all_standings(log=print):
+    """Fetch standings for every discipline; returns {(discipline, gender): athletes}."""
+    return {
+        (discipline, gender): fetch_discipline_standings(discipline, gender, log=log)
+        for discipline, genders in DISCIPLINES.items()
+        for gender in genders
+    }
+
+
+def import_fis_cross_country_data(fetch=None):
+    """
+    Import FIS cross-country skiing data into the database.
+    
+    Args:
+        fetch: Callable returning prefetched fetch_all_standings() output,
+               called after the banner (see run_pipeline.run_all); each
+               discipline is fetched in turn if None
+    """
     print("=" * 60)
     print("FIS CROSS-COUNTRY SKIING PIPELINE")
     print("=" * 60)
     
+    standings = fetch() if fetch is not None else None
+    if standings is not None and not any(standings.values()):
+        print("\n⚠ No standings fetched (scraping failed).")
+        return False
+    
     conn = get_connection()
     cursor = conn.cursor()
     
@@ -176,9 +202,12 @@ def import_fis_cross_country_data():
         
         for gender, competitions in genders.items():
             gender_name = "Men" if gender == "M" else "Women"
-            print(f"\n  Fetching {disc_name} {gender_name}...")
-            
-            athletes = fetch_discipline_standings(discipline, gender)
+            if standings is None:
+                print(f"\n  Fetching {disc_name} {gender_name}...")
+                athletes = fetch_discipline_standings(discipline, gender)
+            else:
+                print(f"\n  {disc_name} {gender_name}:")
+                athletes = standings[(discipline, gender)]
             
             if not athletes:
                 print(f"    No data found")
@@ -214,7 +243,6 @@ def import_fis_cross_country_data():
                 print(f"      {a['rank']}. {a['name']} ({a['country']}): {a['points']} pts")
     
     conn.commit()
-    conn.close()
     
     print(f"\n✓ FIS Cross-Country import complete!")
     print(f"  New athletes: {athletes_added}")
@@ -51,7 +51,6 @@ def init_historical_tables():
     """)
     
     conn.commit()
-    conn.close()
     print("  Historical tables initialized")
 
 
@@ -128,7 +127,6 @@ def import_historical_data():
             print(f"    {entry['rank']}. {entry['country']}: {entry['gold']}G {entry['silver']}S {entry['bronze']}B = {entry['total']}")
     
     conn.commit()
-    conn.close()
     
     print(f"\n✓ Historical import complete!")
     print(f"  Olympics: {olympics_count}")
@@ -145,7 +143,6 @@ def get_historical_stats():
     # Check if tables exist
     cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='historical_medals'")
     if not cursor.fetchone():
-        conn.close()
         return None
     
     stats = {}
@@ -184,7 +181,6 @@ def get_historical_stats():
     """)
     stats["nordic_history"] = cursor.fetchall()
     
-    conn.close()
     return stats
 
 
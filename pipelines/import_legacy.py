@@ -8,6 +8,11 @@ from pathlib import Path
 from datetime import datetime
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: stdlib json gives the same result, just slower
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from database import get_connection, init_db
 from excluded_athletes import get_excluded_set, get_excluded_with_reasons
@@ -16,6 +21,14 @@ from excluded_athletes import get_excluded_set, get_excluded_with_reasons
 LEGACY_DATA_DIR = Path(__file__).parent.parent / "data"
 
 
+def load_json(path: Path):
+    """Load a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
 def import_legacy_data():
     """Import all legacy JSON data into the database."""
     print("=" * 60)
@@ -29,17 +42,10 @@ def import_legacy_data():
     cursor = conn.cursor()
     
     # Load legacy JSON files
-    with open(LEGACY_DATA_DIR / "sports.json") as f:
-        sports = json.load(f)
-    
-    with open(LEGACY_DATA_DIR / "competitions.json") as f:
-        competitions = json.load(f)
-    
-    with open(LEGACY_DATA_DIR / "athletes.json") as f:
-        athletes = json.load(f)
-    
-    with open(LEGACY_DATA_DIR / "entries.json") as f:
-        entries = json.load(f)
+    sports = load_json(LEGACY_DATA_DIR / "sports.json")
+    competitions = load_json(LEGACY_DATA_DIR / "competitions.json")
+    athletes = load_json(LEGACY_DATA_DIR / "athletes.json")
+    entries = load_json(LEGACY_DATA_DIR / "entries.json")
     
     # Import sports
     print(f"\nImporting {len(sports)} sports...")
@@ -134,7 +140,6 @@ def import_legacy_data():
     print(f"  Imported: {imported_entries}, Skipped (excluded): {skipped_entries}")
     
     conn.commit()
-    conn.close()
     
     print("\n✓ Legacy import complete!")
     
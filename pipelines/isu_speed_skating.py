@@ -9,20 +9,45 @@ API: https://api.isuresults.eu
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: response.json() gives the same result, just slower
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from database import get_connection
 
 BASE_URL = "https://api.isuresults.eu"
 
+# Concurrent API requests while aggregating standings
+MAX_WORKERS = 16
+
+# One pooled keep-alive session for all API calls, so the many small
+# requests in aggregate_wc_standings reuse TCP/TLS connections instead of
+# opening a new one each time. Transient failures are retried with backoff.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+))
+
 # WC points table
 WC_POINTS = {1: 100, 2: 80, 3: 60, 4: 50, 5: 45, 6: 40, 7: 36, 8: 32, 9: 29, 10: 26,
              11: 24, 12: 22, 13: 20, 14: 18, 15: 16, 16: 15, 17: 14, 18: 13, 19: 12, 20: 11,
              21: 10, 22: 9, 23: 8, 24: 7, 25: 6, 26: 5, 27: 4, 28: 3, 29: 2, 30: 1}
 
+# Same table indexed directly by rank (index 0 unused)
+WC_POINTS_BY_RANK = (0,) + tuple(WC_POINTS[rank] for rank in range(1, 31))
+
 # Map ISU distance names to our competition IDs
 DISTANCE_MAP = {
     "500 Meter": {"M": "speed-skating-m-500m", "F": "speed-skating-w-500m"},
@@ -35,70 +60,100 @@ DISTANCE_MAP = {
 }
 
 
+# Athlete ID cleanup in one pass: spaces become hyphens, dots/commas are dropped
+_ID_TRANS = str.maketrans({" ": "-", ".": None, ",": None})
+
+
 def create_athlete_id(name: str, country: str) -> str:
     """Create a consistent athlete ID."""
-    clean_name = name.lower().replace(" ", "-").replace(".", "").replace(",", "")
+    clean_name = name.lower().translate(_ID_TRANS)
     return f"{clean_name}-{country.lower()}"
 
 
-def fetch_world_cup_events(season: str = "2025"):
-    """Fetch World Cup events for the season."""
+def _parse_json(response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def fetch_world_cup_events(season: str = "2025", log=print):
+    """Fetch World Cup events for the season. Messages go to log (default: print)."""
     try:
-        response = requests.get(f"{BASE_URL}/events", params={"season": season}, timeout=30)
+        response = SESSION.get(f"{BASE_URL}/events", params={"season": season}, timeout=30)
         response.raise_for_status()
-        data = response.json()
+        data = _parse_json(response)
         events = data.get("results", [])
         wc_events = [e for e in events if "World Cup Speed Skating" in e.get("name", "") 
                      and "Junior" not in e.get("name", "")]
         return wc_events
-    except requests.RequestException as e:
-        print(f"  Error fetching events: {e}")
+    except (requests.RequestException, ValueError) as e:
+        log(f"  Error fetching events: {e}")
         return []
 
 
-def aggregate_wc_standings(wc_events):
+def _get_json(url: str):
+    """GET a URL from the API; returns parsed JSON, or None on a non-200 reply."""
+    r = SESSION.get(url, timeout=30)
+    if r.status_code != 200:
+        return None
+    return _parse_json(r)
+
+
+def aggregate_wc_standings(wc_events, log=print):
     """
     Aggregate WC results across all events to build standings per distance.
     Returns: {distance_key: {skater_id: {name, country, points, isu_id}}}
+    
+    The API calls are I/O-bound, so the competition lists and then the
+    results are fetched concurrently; aggregation happens afterwards on this
+    thread, in the original event/competition order. Progress messages go
+    to log (default: print).
     """
     standings = {}
     
-    for event in wc_events:
-        event_id = event["isuId"]
-        print(f"  Processing: {event['name']}")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        # Stage 1: competitions for every event
+        comp_futures = [
+            pool.submit(_get_json, f"{BASE_URL}/events/{event['isuId']}/competitions/")
+            for event in wc_events
+        ]
         
-        # Get competitions for this event
-        try:
-            r = requests.get(f"{BASE_URL}/events/{event_id}/competitions/", timeout=30)
-            if r.status_code != 200:
-                continue
-            comps = r.json()
-        except Exception as e:
-            print(f"    Error: {e}")
-            continue
-        
-        # Only Division A (main competition)
-        div_a = [c for c in comps if c.get("division") == "A" and c["category"] in ("M", "F")]
-        
-        for comp in div_a:
-            dist_name = comp["distance"]["name"]
-            gender = comp["category"]
-            
-            # Skip distances not in our map (team events)
-            if dist_name not in DISTANCE_MAP:
+        # Stage 2: results for every mapped Division A competition
+        results_futures = []
+        for event, future in zip(wc_events, comp_futures):
+            log(f"  Processing: {event['name']}")
+            try:
+                comps = future.result()
+            except Exception as e:
+                log(f"    Error: {e}")
                 continue
-            if gender not in DISTANCE_MAP[dist_name]:
+            if comps is None:
                 continue
             
-            dist_key = DISTANCE_MAP[dist_name][gender]
+            # Only Division A (main competition)
+            div_a = [c for c in comps if c.get("division") == "A" and c["category"] in ("M", "F")]
             
-            # Get results
-            try:
-                r2 = requests.get(comp["resultsUrl"], timeout=30)
-                if r2.status_code != 200:
+            for comp in div_a:
+                dist_name = comp["distance"]["name"]
+                gender = comp["category"]
+                
+                # Skip distances not in our map (team events)
+                if dist_name not in DISTANCE_MAP:
                     continue
-                results = r2.json()
-            except Exception as e:
+                if gender not in DISTANCE_MAP[dist_name]:
+                    continue
+                
+                dist_key = DISTANCE_MAP[dist_name][gender]
+                results_futures.append((dist_key, pool.submit(_get_json, comp["resultsUrl"])))
+        
+        # Stage 3: aggregate (single-threaded; standings is not shared)
+        for dist_key, future in results_futures:
+            try:
+                results = future.result()
+            except Exception:
+                continue
+            if results is None:
                 continue
             
             if dist_key not in standings:
@@ -124,7 +179,7 @@ def aggregate_wc_standings(wc_events):
                     continue
                 
                 name = f"{first_name} {last_name}".strip()
-                points = WC_POINTS.get(rank, 0)
+                points = WC_POINTS_BY_RANK[rank] if rank > 0 else 0
                 
                 if isu_id not in standings[dist_key]:
                     standings[dist_key][isu_id] = {
@@ -139,24 +194,39 @@ def aggregate_wc_standings(wc_events):
     return standings
 
 
-def import_isu_data():
-    """Import ISU speed skating data into the database."""
-    print("=" * 60)
-    print("ISU SPEED SKATING PIPELINE")
-    print("=" * 60)
-    
-    # Fetch WC events
-    wc_events = fetch_world_cup_events("2025")
+def fetch_isu_standings(season: str = "2025", log=print):
+    """
+    Fetch the season's World Cup events and aggregate them into standings.
+    Network only (no database access); returns {} if no events were found.
+    Progress messages go to log (default: print).
+    """
+    wc_events = fetch_world_cup_events(season, log)
     
     if not wc_events:
-        print("\n⚠ No World Cup events found.")
-        return False
+        log("\n⚠ No World Cup events found.")
+        return {}
     
-    print(f"\n✓ Found {len(wc_events)} World Cup events")
+    log(f"\n✓ Found {len(wc_events)} World Cup events")
     
     # Aggregate standings
-    print("\nAggregating results...")
-    standings = aggregate_wc_standings(wc_events)
+    log("\nAggregating results...")
+    return aggregate_wc_standings(wc_events, log)
+
+
+def import_isu_data(fetch=None):
+    """
+    Import ISU speed skating data into the database.
+    
+    Args:
+        fetch: Callable returning prefetched fetch_isu_standings() output,
+               called after the banner (see run_pipeline.run_all); the
+               standings are fetched here if None
+    """
+    print("=" * 60)
+    print("ISU SPEED SKATING PIPELINE")
+    print("=" * 60)
+    
+    standings = fetch() if fetch is not None else fetch_isu_standings()
     
     if not standings:
         print("\n⚠ No standings aggregated.")
@@ -174,32 +244,35 @@ def import_isu_data():
         print(f"  Cleared {deleted} old ISU entries")
     
     timestamp = datetime.now().isoformat()
-    imported = 0
-    athletes_added = 0
     
+    # Collect all rows first, then write them with two executemany calls
+    # inside the single transaction committed below
+    athlete_rows = []
+    entry_rows = []
     for dist_key, skaters in standings.items():
         # Sort by points to get top skaters
-        sorted_skaters = sorted(skaters.values(), key=lambda x: -x["points"])
+        sorted_skaters = sorted(skaters.values(), key=itemgetter("points"), reverse=True)
         
         for skater in sorted_skaters[:30]:  # Top 30 per distance
             athlete_id = create_athlete_id(skater["name"], skater["country"])
-            
-            # Ensure athlete exists
-            cursor.execute(
-                "INSERT OR IGNORE INTO athletes (id, name, country_code) VALUES (?, ?, ?)",
-                (athlete_id, skater["name"], skater["country"])
-            )
-            if cursor.rowcount > 0:
-                athletes_added += 1
-            
-            # Insert entry (replaces any manual entry for this athlete/competition)
-            cursor.execute(
-                """INSERT OR REPLACE INTO entries 
-                   (athlete_id, competition_id, score, source, updated_at) 
-                   VALUES (?, ?, ?, ?, ?)""",
-                (athlete_id, dist_key, skater["points"], "isu_api", timestamp)
-            )
-            imported += 1
+            athlete_rows.append((athlete_id, skater["name"], skater["country"]))
+            entry_rows.append((athlete_id, dist_key, skater["points"], "isu_api", timestamp))
+    
+    # Ensure athletes exist (rowcount sums the rows actually inserted)
+    cursor.executemany(
+        "INSERT OR IGNORE INTO athletes (id, name, country_code) VALUES (?, ?, ?)",
+        athlete_rows
+    )
+    athletes_added = cursor.rowcount
+    
+    # Insert entries (replaces any manual entry for this athlete/competition)
+    cursor.executemany(
+        """INSERT OR REPLACE INTO entries 
+           (athlete_id, competition_id, score, source, updated_at) 
+           VALUES (?, ?, ?, ?, ?)""",
+        entry_rows
+    )
+    imported = len(entry_rows)
     
     # Also remove manual entries for speed skating (ISU data is better)
     cursor.execute(
@@ -208,7 +281,6 @@ def import_isu_data():
     removed_manual = cursor.rowcount
     
     conn.commit()
-    conn.close()
     
     print(f"\n✓ ISU import complete!")
     print(f"  New athletes: {athletes_added}")
@@ -218,7 +290,7 @@ def import_isu_data():
     # Print standings summary
     print("\n=== STANDINGS SUMMARY ===")
     for dist_key in sorted(standings.keys()):
-        sorted_skaters = sorted(standings[dist_key].values(), key=lambda x: -x["points"])[:3]
+        sorted_skaters = sorted(standings[dist_key].values(), key=itemgetter("points"), reverse=True)[:3]
         print(f"\n{dist_key}:")
         for i, s in enumerate(sorted_skaters, 1):
             print(f"  {i}. {s['name']} ({s['country']}): {s['points']} pts")
@@ -230,7 +302,7 @@ def test_api_connection():
     """Test if ISU API is accessible."""
     print("Testing ISU API connection...")
     try:
-        response = requests.get(f"{BASE_URL}/events", params={"limit": 1}, timeout=10)
+        response = SESSION.get(f"{BASE_URL}/events", params={"limit": 1}, timeout=10)
         if response.status_code == 200:
             print("  ✓ API accessible")
             return True
@@ -15,11 +15,13 @@ Pipeline:
 5. Output both to separate files for comparison in Streamlit
 """
 
+import os
 import random
 from collections import defaultdict
+from operator import attrgetter
 from pathlib import Path
 
-from database import get_connection
+from database import close_connection, get_connection
 from model import PlackettLuceModel, AthleteStrength, create_athletes_from_scores
 from simulator import MonteCarloSimulator, SimulationConfig
 from models import (
@@ -37,6 +39,15 @@ from models import (
 STRENGTH_POWER = 2.0      # Power transformation for scores
 NUM_SIMULATIONS = 100000  # Monte Carlo iterations
 EXTRA_NOISE = 0.0         # Extra noise beyond Plackett-Luce (0 = pure model)
+MAX_WORKERS = 8           # Cap on threads per competition simulation
+
+# Threads per competition simulation: the CPUs in this process's affinity
+# mask where the OS reports it (not every host CPU), capped at MAX_WORKERS
+# since a container's CPU quota can still be lower than that
+if hasattr(os, "sched_getaffinity"):
+    NUM_WORKERS = min(len(os.sched_getaffinity(0)), MAX_WORKERS)
+else:
+    NUM_WORKERS = min(os.cpu_count() or 1, MAX_WORKERS)
 
 OUTPUT_DIR = Path(__file__).parent / "output"
 SINGLE_RUN_DIR = Path(__file__).parent / "output" / "single_run"
@@ -99,7 +110,6 @@ def load_data_from_db():
                 "score": score
             })
     
-    conn.close()
     return competitions, entries_by_comp
 
 
@@ -130,7 +140,8 @@ def run_predictions(competitions, entries_by_comp, num_simulations, label=""):
     
     config = SimulationConfig(
         num_simulations=num_simulations,
-        extra_noise_scale=EXTRA_NOISE
+        extra_noise_scale=EXTRA_NOISE,
+        num_workers=NUM_WORKERS
     )
     simulator = MonteCarloSimulator(model, config)
     
@@ -138,10 +149,7 @@ def run_predictions(competitions, entries_by_comp, num_simulations, label=""):
     print(f"\n[2/3] Processing {len(entries_by_comp)} competitions...")
     
     competition_results = []
-    country_totals = defaultdict(lambda: {
-        "gold": 0, "silver": 0, "bronze": 0,
-        "breakdowns": []
-    })
+    country_totals = {}
     
     comp_count = 0
     for comp_id, entries in entries_by_comp.items():
@@ -154,19 +162,17 @@ def run_predictions(competitions, entries_by_comp, num_simulations, label=""):
         # Create AthleteStrength objects
         athletes = create_athletes_from_scores(entries)
         
-        # Get exact predictions from model
+        # Get exact predictions from model (same order as athletes)
         exact_predictions = model.predict(athletes)
         
-        # Run simulation
+        # Run simulation (results also follow the athletes order)
         sim_results = simulator.simulate_competition(athletes)
         
         # Build athlete results (using simulation results)
         athlete_results = []
-        country_comp_medals = defaultdict(lambda: {
-            "gold": 0, "silver": 0, "bronze": 0, "athletes": []
-        })
+        country_comp_medals = {}
         
-        for sim_result in sim_results:
+        for sim_result, ep in zip(sim_results, exact_predictions):
             result = AthleteCompetitionResult(
                 athlete_id=sim_result.athlete_id,
                 athlete_name=sim_result.name,
@@ -180,31 +186,30 @@ def run_predictions(competitions, entries_by_comp, num_simulations, label=""):
             )
             
             # Get score/strength from exact predictions
-            for ep in exact_predictions:
-                if ep.athlete_id == sim_result.athlete_id:
-                    result.score = ep.score
-                    result.strength = ep.strength
-                    break
+            result.score = ep.score
+            result.strength = ep.strength
             
             athlete_results.append(result)
             
-            # Aggregate by country for this competition
+            # Aggregate by country for this competition, tracking the top
+            # athlete as we go rather than collecting every athlete
             country = sim_result.country
-            country_comp_medals[country]["gold"] += sim_result.sim_gold_prob
-            country_comp_medals[country]["silver"] += sim_result.sim_silver_prob
-            country_comp_medals[country]["bronze"] += sim_result.sim_bronze_prob
-            country_comp_medals[country]["athletes"].append({
-                "name": sim_result.name,
-                "gold_prob": sim_result.sim_gold_prob
-            })
-            
-            # Add to country totals
-            country_totals[country]["gold"] += sim_result.sim_gold_prob
-            country_totals[country]["silver"] += sim_result.sim_silver_prob
-            country_totals[country]["bronze"] += sim_result.sim_bronze_prob
+            medals = country_comp_medals.get(country)
+            if medals is None:
+                medals = country_comp_medals[country] = {
+                    "gold": 0, "silver": 0, "bronze": 0,
+                    "top_athlete": sim_result.name,
+                    "top_athlete_gold_prob": sim_result.sim_gold_prob
+                }
+            elif sim_result.sim_gold_prob > medals["top_athlete_gold_prob"]:
+                medals["top_athlete"] = sim_result.name
+                medals["top_athlete_gold_prob"] = sim_result.sim_gold_prob
+            medals["gold"] += sim_result.sim_gold_prob
+            medals["silver"] += sim_result.sim_silver_prob
+            medals["bronze"] += sim_result.sim_bronze_prob
         
         # Sort by gold probability
-        athlete_results.sort(key=lambda x: -x.gold_prob)
+        athlete_results.sort(key=attrgetter("gold_prob"), reverse=True)
         
         # Create CompetitionResult
         competition_results.append(CompetitionResult(
@@ -215,14 +220,22 @@ def run_predictions(competitions, entries_by_comp, num_simulations, label=""):
             athlete_results=athlete_results
         ))
         
-        # Create CountryCompetitionBreakdown for each country
+        # Fold this competition into the country totals (once per country,
+        # not once per athlete) and create a CountryCompetitionBreakdown
         for country, medals in country_comp_medals.items():
+            totals = country_totals.get(country)
+            if totals is None:
+                totals = country_totals[country] = {
+                    "gold": 0, "silver": 0, "bronze": 0, "breakdowns": []
+                }
+            totals["gold"] += medals["gold"]
+            totals["silver"] += medals["silver"]
+            totals["bronze"] += medals["bronze"]
+            
             total = medals["gold"] + medals["silver"] + medals["bronze"]
             if total < 0.01:
                 continue
             
-            top_athlete = max(medals["athletes"], key=lambda x: x["gold_prob"])
-            
             breakdown = CountryCompetitionBreakdown(
                 country=country,
                 sport=comp_info["sport_name"],
@@ -231,10 +244,10 @@ def run_predictions(competitions, entries_by_comp, num_simulations, label=""):
                 expected_gold=medals["gold"],
                 expected_silver=medals["silver"],
                 expected_bronze=medals["bronze"],
-                top_athlete=top_athlete["name"],
-                top_athlete_gold_prob=top_athlete["gold_prob"]
+                top_athlete=medals["top_athlete"],
+                top_athlete_gold_prob=medals["top_athlete_gold_prob"]
             )
-            country_totals[country]["breakdowns"].append(breakdown)
+            totals["breakdowns"].append(breakdown)
         
         if comp_count % 20 == 0:
             print(f"      Processed {comp_count} competitions...")
@@ -256,7 +269,7 @@ def run_predictions(competitions, entries_by_comp, num_simulations, label=""):
         country_summaries.append(summary)
     
     # Sort by total medals
-    country_summaries.sort(key=lambda x: -x.total)
+    country_summaries.sort(key=attrgetter("total"), reverse=True)
     
     # Create SimulationOutput
     output = SimulationOutput(
@@ -275,6 +288,7 @@ def main():
     # Load data once
     print("Loading data from database...")
     competitions, entries_by_comp = load_data_from_db()
+    close_connection()  # Everything below works from memory
     print(f"  {len(competitions)} competitions")
     print(f"  {sum(len(e) for e in entries_by_comp.values())} total entries")
     
@@ -19,13 +19,62 @@ Usage:
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-from database import init_db, get_stats
+from database import close_connection, get_connection, init_db, get_stats
 from pipelines.import_legacy import import_legacy_data
 
 
+def _fetch_isu(log):
+    """Fetch ISU standings (network only)."""
+    from pipelines.isu_speed_skating import fetch_isu_standings
+    return fetch_isu_standings(log=log)
+
+
+def _fetch_fis_alpine(log):
+    """Fetch FIS Alpine standings (network only)."""
+    from pipelines.fis_alpine import fetch_all_standings
+    return fetch_all_standings(log=log)
+
+
+def _fetch_fis_xc(log):
+    """Fetch FIS Cross-Country standings (network only)."""
+    from pipelines.fis_cross_country import fetch_all_standings
+    return fetch_all_standings(log=log)
+
+
+def _start_fetch(pool, fetch):
+    """Submit a background fetch whose messages are buffered, not printed."""
+    lines = []
+    return pool.submit(fetch, lines.append), lines
+
+
+def _join_fetch(fetch):
+    """Wait for a background fetch, then print its buffered messages here."""
+    future, lines = fetch
+    try:
+        return future.result()
+    finally:
+        for line in lines:
+            print(line)
+
+
 def run_all():
-    """Run all pipelines in order."""
+    """
+    Run all pipelines.
+    
+    The ISU and FIS downloads do not touch the database, so they run in
+    background threads while the legacy import runs. Their messages are
+    buffered and printed under each pipeline's banner, when its importer
+    joins the fetch. Database writes still happen one pipeline at a time,
+    in order, on this thread: later sources replace the manual entries
+    written by the legacy import.
+    
+    All pipelines share one connection, so a failed import is rolled back
+    before moving on; otherwise the next pipeline's commit would persist
+    its partial writes (e.g. the delete of old entries).
+    """
     print("=" * 60)
     print("DATA PIPELINE")
     print("=" * 60)
@@ -34,42 +83,41 @@ def run_all():
     print("\n[1/6] Initializing database...")
     init_db()
     
-    # Step 2: Import legacy data
-    print("\n[2/6] Importing legacy data...")
-    import_legacy_data()
-    
-    # Step 3: ISU Speed Skating API
-    print("\n[3/6] Checking ISU API...")
-    try:
-        from pipelines.isu_speed_skating import test_api_connection, import_isu_data
-        if test_api_connection():
-            import_isu_data()
-        else:
-            print("  Skipping ISU import (API not accessible)")
-    except Exception as e:
-        print(f"  Skipping ISU import: {e}")
-    
-    # Step 4: FIS Alpine Skiing
-    print("\n[4/6] Fetching FIS Alpine data...")
-    try:
-        from pipelines.fis_alpine import test_scraping, import_fis_alpine_data
-        if test_scraping():
-            import_fis_alpine_data()
-        else:
-            print("  Skipping FIS Alpine import (scraping failed)")
-    except Exception as e:
-        print(f"  Skipping FIS Alpine import: {e}")
-    
-    # Step 5: FIS Cross-Country Skiing
-    print("\n[5/6] Fetching FIS Cross-Country data...")
-    try:
-        from pipelines.fis_cross_country import test_scraping as test_xc, import_fis_cross_country_data
-        if test_xc():
-            import_fis_cross_country_data()
-        else:
-            print("  Skipping FIS XC import (scraping failed)")
-    except Exception as e:
-        print(f"  Skipping FIS XC import: {e}")
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        isu_fetch = _start_fetch(pool, _fetch_isu)
+        alpine_fetch = _start_fetch(pool, _fetch_fis_alpine)
+        xc_fetch = _start_fetch(pool, _fetch_fis_xc)
+        
+        # Step 2: Import legacy data
+        print("\n[2/6] Importing legacy data...")
+        import_legacy_data()
+        
+        # Step 3: ISU Speed Skating API
+        print("\n[3/6] Importing ISU data...")
+        try:
+            from pipelines.isu_speed_skating import import_isu_data
+            import_isu_data(partial(_join_fetch, isu_fetch))
+        except Exception as e:
+            get_connection().rollback()
+            print(f"  Skipping ISU import: {e}")
+        
+        # Step 4: FIS Alpine Skiing
+        print("\n[4/6] Importing FIS Alpine data...")
+        try:
+            from pipelines.fis_alpine import import_fis_alpine_data
+            import_fis_alpine_data(partial(_join_fetch, alpine_fetch))
+        except Exception as e:
+            get_connection().rollback()
+            print(f"  Skipping FIS Alpine import: {e}")
+        
+        # Step 5: FIS Cross-Country Skiing
+        print("\n[5/6] Importing FIS Cross-Country data...")
+        try:
+            from pipelines.fis_cross_country import import_fis_cross_country_data
+            import_fis_cross_country_data(partial(_join_fetch, xc_fetch))
+        except Exception as e:
+            get_connection().rollback()
+            print(f"  Skipping FIS XC import: {e}")
     
     # Step 6: Historical Olympics Data
     print("\n[6/6] Importing historical Olympics data...")
@@ -77,6 +125,7 @@ def run_all():
         from pipelines.import_historical import import_historical_data
         import_historical_data()
     except Exception as e:
+        get_connection().rollback()
         print(f"  Skipping historical import: {e}")
     
     # Final stats
@@ -93,6 +142,8 @@ def run_all():
     print(f"  Entries:      {stats['entries']}")
     print(f"  Excluded:     {stats['excluded_athletes']}")
     print(f"\n  Entries by source: {stats['entries_by_source']}")
+    
+    close_connection()
 
 
 def run_legacy_only():
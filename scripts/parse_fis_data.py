@@ -4,11 +4,21 @@ Parse World Cup standings data and generate athlete/entry JSON files.
 Data sources: FIS, IBU, ISU - January 2026
 """
 
+import heapq
 import json
 import re
+from array import array
+from collections import defaultdict
 from datetime import date
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: stdlib json writes the same file, just slower
+
 # Get the directory where this script is located
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR.parent / "data"
@@ -298,8 +308,8 @@ SKI_JUMPING_WOMEN = [
 
 SPEED_SKATING_MEN = [
     ("Jordan Stolz", "USA", 871),
-    ("Jenning De Boo", "NED", 481),
     ("Damian Zurek", "POL", 501),
+    ("Jenning De Boo", "NED", 481),
     ("Kjeld Nuis", "NED", 396),
     ("Ning Zhongyan", "CHN", 388),
     ("Sander Eitrem", "NOR", 350),
@@ -402,8 +412,8 @@ FREESTYLE_MOGULS_WOMEN = [
 ]
 
 FREESTYLE_AERIALS_MEN = [
-    ("Qi Guangpu", "CHN", 400),
     ("Noe Roth", "SUI", 400),
+    ("Qi Guangpu", "CHN", 400),
     ("Wang Xindi", "CHN", 304),
     ("Sun Jiaxu", "CHN", 298),
     ("Christopher Lillis", "USA", 274),
@@ -843,183 +853,210 @@ HOCKEY_WOMEN = [
 # TEAM/RELAY EVENTS (Nation-level entries)
 # =============================================================================
 
+# Team/relay tables list (country, points); the team name is normally the
+# same in every event, so it is looked up here instead of repeated on each
+# row. A sport config can override names for its own table ("team_names").
+TEAM_NAMES = {
+    "AUT": "Team Austria",
+    "CAN": "Team Canada",
+    "CHN": "Team China",
+    "CZE": "Team Czechia",
+    "FIN": "Team Finland",
+    "FRA": "Team France",
+    "GBR": "Team Great Britain",
+    "GER": "Team Germany",
+    "HUN": "Team Hungary",
+    "ITA": "Team Italy",
+    "JPN": "Team Japan",
+    "KOR": "Team South Korea",
+    "NED": "Team Netherlands",
+    "NOR": "Team Norway",
+    "POL": "Team Poland",
+    "SLO": "Team Slovenia",
+    "SUI": "Team Switzerland",
+    "SWE": "Team Sweden",
+    "UKR": "Team Ukraine",
+    "USA": "Team USA",
+}
+
 # Cross-Country Relay - Men's 4x10km (FIS Nations Cup standings)
 CROSS_COUNTRY_RELAY_MEN = [
-    ("Team Norway", "NOR", 8096),
-    ("Team Sweden", "SWE", 6812),
-    ("Team Germany", "GER", 5731),
-    ("Team Finland", "FIN", 5420),
-    ("Team France", "FRA", 4800),
-    ("Team Italy", "ITA", 3500),
-    ("Team Switzerland", "SUI", 3200),
-    ("Team USA", "USA", 2800),
+    ("NOR", 8096),
+    ("SWE", 6812),
+    ("GER", 5731),
+    ("FIN", 5420),
+    ("FRA", 4800),
+    ("ITA", 3500),
+    ("SUI", 3200),
+    ("USA", 2800),
 ]
 
 # Cross-Country Relay - Women's 4x5km (FIS Nations Cup standings)
 CROSS_COUNTRY_RELAY_WOMEN = [
-    ("Team Sweden", "SWE", 7500),
-    ("Team Norway", "NOR", 7200),
-    ("Team Finland", "FIN", 5800),
-    ("Team Germany", "GER", 5400),
-    ("Team USA", "USA", 4200),
-    ("Team Switzerland", "SUI", 3000),
-    ("Team Italy", "ITA", 2500),
-    ("Team Austria", "AUT", 2000),
+    ("SWE", 7500),
+    ("NOR", 7200),
+    ("FIN", 5800),
+    ("GER", 5400),
+    ("USA", 4200),
+    ("SUI", 3000),
+    ("ITA", 2500),
+    ("AUT", 2000),
 ]
 
 # Cross-Country Team Sprint - Men (Top 2 athletes per nation aggregated)
 CROSS_COUNTRY_TEAM_SPRINT_MEN = [
-    ("Team Norway", "NOR", 3730),   # Klaebo + Valnes
-    ("Team Sweden", "SWE", 2689),   # Anger + Poromaa
-    ("Team France", "FRA", 2119),   # Lapalus + Desloges
-    ("Team Finland", "FIN", 1644),  # Niskanen + Vuorinen
-    ("Team USA", "USA", 2052),      # Ogden + Schumacher
-    ("Team Germany", "GER", 1004),
-    ("Team Italy", "ITA", 1510),    # Pellegrino
-    ("Team Switzerland", "SUI", 492),
+    ("NOR", 3730),  # Klaebo + Valnes
+    ("SWE", 2689),  # Anger + Poromaa
+    ("FRA", 2119),  # Lapalus + Desloges
+    ("USA", 2052),  # Ogden + Schumacher
+    ("FIN", 1644),  # Niskanen + Vuorinen
+    ("ITA", 1510),  # Pellegrino
+    ("GER", 1004),
+    ("SUI", 492),
 ]
 
 # Cross-Country Team Sprint - Women (Top 2 athletes per nation aggregated)
 CROSS_COUNTRY_TEAM_SPRINT_WOMEN = [
-    ("Team Sweden", "SWE", 3167),   # Ilar + Sundling
-    ("Team Norway", "NOR", 2755),   # Simpson-Larsen + Weng
-    ("Team Finland", "FIN", 3049),  # Niskanen + Joensuu
-    ("Team Germany", "GER", 2977),  # Carl + Hennig
-    ("Team USA", "USA", 3147),      # Diggins + Brennan
-    ("Team Switzerland", "SUI", 700),
-    ("Team Italy", "ITA", 550),
-    ("Team Austria", "AUT", 1200),
+    ("SWE", 3167),  # Ilar + Sundling
+    ("USA", 3147),  # Diggins + Brennan
+    ("FIN", 3049),  # Niskanen + Joensuu
+    ("GER", 2977),  # Carl + Hennig
+    ("NOR", 2755),  # Simpson-Larsen + Weng
+    ("AUT", 1200),
+    ("SUI", 700),
+    ("ITA", 550),
 ]
 
 # Biathlon Relay - Men's 4x7.5km (IBU Nations Cup relay standings)
 BIATHLON_RELAY_MEN = [
-    ("Team France", "FRA", 90),
-    ("Team Norway", "NOR", 75),
-    ("Team Sweden", "SWE", 60),
-    ("Team Germany", "GER", 50),
-    ("Team Finland", "FIN", 45),
-    ("Team USA", "USA", 40),
-    ("Team Ukraine", "UKR", 36),
-    ("Team Switzerland", "SUI", 34),
-    ("Team Austria", "AUT", 32),
-    ("Team Italy", "ITA", 31),
+    ("FRA", 90),
+    ("NOR", 75),
+    ("SWE", 60),
+    ("GER", 50),
+    ("FIN", 45),
+    ("USA", 40),
+    ("UKR", 36),
+    ("SUI", 34),
+    ("AUT", 32),
+    ("ITA", 31),
 ]
 
 # Biathlon Relay - Women's 4x6km (IBU Nations Cup relay standings)
 BIATHLON_RELAY_WOMEN = [
-    ("Team France", "FRA", 85),
-    ("Team Sweden", "SWE", 70),
-    ("Team Germany", "GER", 65),
-    ("Team Norway", "NOR", 60),
-    ("Team Finland", "FIN", 50),
-    ("Team Italy", "ITA", 45),
-    ("Team Switzerland", "SUI", 40),
-    ("Team USA", "USA", 35),
-    ("Team Austria", "AUT", 30),
-    ("Team Czechia", "CZE", 25),
+    ("FRA", 85),
+    ("SWE", 70),
+    ("GER", 65),
+    ("NOR", 60),
+    ("FIN", 50),
+    ("ITA", 45),
+    ("SUI", 40),
+    ("USA", 35),
+    ("AUT", 30),
+    ("CZE", 25),
 ]
 
 # Biathlon Mixed Relay (IBU Nations Cup)
 BIATHLON_MIXED_RELAY = [
-    ("Team France", "FRA", 95),
-    ("Team Norway", "NOR", 80),
-    ("Team Sweden", "SWE", 75),
-    ("Team Germany", "GER", 65),
-    ("Team Italy", "ITA", 55),
-    ("Team Finland", "FIN", 50),
-    ("Team Switzerland", "SUI", 45),
-    ("Team USA", "USA", 40),
-    ("Team Austria", "AUT", 35),
-    ("Team Czechia", "CZE", 30),
+    ("FRA", 95),
+    ("NOR", 80),
+    ("SWE", 75),
+    ("GER", 65),
+    ("ITA", 55),
+    ("FIN", 50),
+    ("SUI", 45),
+    ("USA", 40),
+    ("AUT", 35),
+    ("CZE", 30),
 ]
 
 # Ski Jumping Team - Men's Large Hill (Top 4 jumpers per nation aggregated)
 SKI_JUMPING_TEAM_MEN = [
-    ("Team Austria", "AUT", 3280),   # Kraft + Hoerl + Tschofenig + Hayboeck
-    ("Team Germany", "GER", 1310),   # Paschke + Geiger + Wellinger + Eisenbichler
-    ("Team Slovenia", "SLO", 1720),  # Lanisek + D.Prevc + P.Prevc + Kos
-    ("Team Norway", "NOR", 2050),    # Forfang + Lindvik + Granerud + Johansson
-    ("Team Japan", "JPN", 1060),     # Kobayashi + Nikaido
-    ("Team Poland", "POL", 800),     # Kubacki + Zyla + Stoch
-    ("Team Switzerland", "SUI", 750),
-    ("Team Finland", "FIN", 120),
+    ("AUT", 3280),  # Kraft + Hoerl + Tschofenig + Hayboeck
+    ("NOR", 2050),  # Forfang + Lindvik + Granerud + Johansson
+    ("SLO", 1720),  # Lanisek + D.Prevc + P.Prevc + Kos
+    ("GER", 1310),  # Paschke + Geiger + Wellinger + Eisenbichler
+    ("JPN", 1060),  # Kobayashi + Nikaido
+    ("POL", 800),   # Kubacki + Zyla + Stoch
+    ("SUI", 750),
+    ("FIN", 120),
 ]
 
 # Ski Jumping Mixed Team (Top 2 men + top 2 women per nation)
 SKI_JUMPING_MIXED_TEAM = [
-    ("Team Austria", "AUT", 3179),   # Kraft + Hoerl + Eder + Pinkelnig
-    ("Team Slovenia", "SLO", 2906),  # Lanisek + D.Prevc + N.Prevc + Vodan
-    ("Team Germany", "GER", 2247),   # Paschke + Geiger + Freitag + Schmid
-    ("Team Norway", "NOR", 1907),    # Forfang + Lindvik + Stroem + Opseth
-    ("Team Japan", "JPN", 2066),     # Kobayashi + Nikaido + Maruyama + Takanashi
-    ("Team Canada", "CAN", 904),     # Strate + Loutitt
-    ("Team France", "FRA", 320),
-    ("Team Switzerland", "SUI", 750),
+    ("AUT", 3179),  # Kraft + Hoerl + Eder + Pinkelnig
+    ("SLO", 2906),  # Lanisek + D.Prevc + N.Prevc + Vodan
+    ("GER", 2247),  # Paschke + Geiger + Freitag + Schmid
+    ("JPN", 2066),  # Kobayashi + Nikaido + Maruyama + Takanashi
+    ("NOR", 1907),  # Forfang + Lindvik + Stroem + Opseth
+    ("CAN", 904),   # Strate + Loutitt
+    ("SUI", 750),
+    ("FRA", 320),
 ]
 
 # Nordic Combined Team Sprint - Men (Top 2 per nation)
 NORDIC_COMBINED_TEAM_MEN = [
-    ("Team Germany", "GER", 2606),   # Geiger + Schmid
-    ("Team Austria", "AUT", 2167),   # Lamparter + Rettenegger
-    ("Team Japan", "JPN", 1350),     # Yamamoto + Watabe
-    ("Team Norway", "NOR", 1400),    # Oftebro + Graabak
-    ("Team Finland", "FIN", 1350),   # Herola + Hirvonen
-    ("Team France", "FRA", 500),
-    ("Team USA", "USA", 400),
-    ("Team Italy", "ITA", 300),
+    ("GER", 2606),  # Geiger + Schmid
+    ("AUT", 2167),  # Lamparter + Rettenegger
+    ("NOR", 1400),  # Oftebro + Graabak
+    ("FIN", 1350),  # Herola + Hirvonen
+    ("JPN", 1350),  # Yamamoto + Watabe
+    ("FRA", 500),
+    ("USA", 400),
+    ("ITA", 300),
 ]
 
 # Speed Skating Team Pursuit - Men (Nations based on individual depth)
 SPEED_SKATING_TEAM_PURSUIT_MEN = [
-    ("Team Netherlands", "NED", 1577),  # De Boo + Nuis + Roest + Bergsma
-    ("Team Norway", "NOR", 770),        # Eitrem + Lorentzen + Kongshaug + Johansson
-    ("Team USA", "USA", 941),           # Stolz + Mantia
-    ("Team Italy", "ITA", 285),
-    ("Team Canada", "CAN", 70),
-    ("Team China", "CHN", 393),
-    ("Team South Korea", "KOR", 30),
-    ("Team Poland", "POL", 501),
+    ("NED", 1577),  # De Boo + Nuis + Roest + Bergsma
+    ("USA", 941),   # Stolz + Mantia
+    ("NOR", 770),   # Eitrem + Lorentzen + Kongshaug + Johansson
+    ("POL", 501),
+    ("CHN", 393),
+    ("ITA", 285),
+    ("CAN", 70),
+    ("KOR", 30),
 ]
 
 # Speed Skating Team Pursuit - Women (Nations based on individual depth)
 SPEED_SKATING_TEAM_PURSUIT_WOMEN = [
-    ("Team Netherlands", "NED", 1662),  # Kok + Rijpma-de Jong + Beune + Fledderus
-    ("Team Japan", "JPN", 1019),        # Takagi + Yoshida + Takagi + Sato
-    ("Team Canada", "CAN", 565),        # Weidemann + Maltais + Blondin
-    ("Team USA", "USA", 762),           # Jackson + Bowe + Manganello
-    ("Team Norway", "NOR", 370),        # Wiklund + Njatun + Haugen
-    ("Team Italy", "ITA", 80),
-    ("Team Czechia", "CZE", 160),
-    ("Team South Korea", "KOR", 10),
+    ("NED", 1662),  # Kok + Rijpma-de Jong + Beune + Fledderus
+    ("JPN", 1019),  # Takagi + Yoshida + Takagi + Sato
+    ("USA", 762),   # Jackson + Bowe + Manganello
+    ("CAN", 565),   # Weidemann + Maltais + Blondin
+    ("NOR", 370),   # Wiklund + Njatun + Haugen
+    ("CZE", 160),
+    ("ITA", 80),
+    ("KOR", 10),
 ]
 
 # Curling Mixed Doubles (WCF Team Rankings - using ranking points)
 CURLING_MIXED_DOUBLES = [
-    ("Team Scotland", "GBR", 60254),    # Scotland competes as GBR at Olympics
-    ("Team Italy", "ITA", 58603),
-    ("Team Norway", "NOR", 53254),
-    ("Team Sweden", "SWE", 50857),
-    ("Team Switzerland", "SUI", 48000),
-    ("Team Canada", "CAN", 45000),
-    ("Team USA", "USA", 42000),
-    ("Team South Korea", "KOR", 38000),
-    ("Team Japan", "JPN", 35000),
-    ("Team Hungary", "HUN", 32000),
+    ("GBR", 60254), # Scotland competes as GBR at Olympics
+    ("ITA", 58603),
+    ("NOR", 53254),
+    ("SWE", 50857),
+    ("SUI", 48000),
+    ("CAN", 45000),
+    ("USA", 42000),
+    ("KOR", 38000),
+    ("JPN", 35000),
+    ("HUN", 32000),
 ]
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
-NORDIC_COUNTRIES = {"NOR", "SWE", "FIN", "DEN"}
+NORDIC_COUNTRIES = frozenset({"NOR", "SWE", "FIN", "DEN"})
+_NORDIC_SORTED = tuple(sorted(NORDIC_COUNTRIES))
 
 # Athletes excluded from predictions (injury, retirement, etc.)
-EXCLUDED_ATHLETES = {
+EXCLUDED_ATHLETES = frozenset({
     ("Aleksander Aamodt Kilde", "NOR"),  # Injury - shoulder injury and sepsis, uncertain return
     ("Alexander Steen Olsen", "NOR"),    # Knee surgery Dec 2025 - out for 2025/26 season including Olympics
     ("Lara Gut-Behrami", "SUI"),         # ACL tear Nov 2024 - confirmed out for 2026 Olympics
     # ("Therese Johaug", "NOR"),         # Retired May 2025 - not in current WC standings anyway
-}
+})
 
 SPORT_CONFIG = [
     # Cross-Country Skiing
@@ -1406,108 +1443,173 @@ SPORT_CONFIG = [
         "data": CURLING_MIXED_DOUBLES,
         "events": ["curling-x-mixed-doubles"],
         "source": "https://worldcurling.org/teamrankings/mixed-doubles/",
-        "type": "team"
+        "type": "team",
+        "team_names": {"GBR": "Team Scotland"},  # Scotland competes as GBR
     },
 ]
 
+def _build_tables():
+    """
+    Flatten SPORT_CONFIG into column tables once at import.
+    
+    Every standings line gets one slot in the parallel _NAMES / _COUNTRIES /
+    _POINTS columns; each sport is a (start, end, is_team, events, source_url)
+    slice over them, so main() walks plain index ranges instead of nested
+    config dicts and per-line tuples. Within a slice the lines are in
+    standings order (points descending, then name), whatever order the
+    hand-edited lists above are in.
+    """
+    names, countries, points, slices = [], [], [], []
+    for config in SPORT_CONFIG:
+        start = len(names)
+        is_team = config.get("type") == "team"
+        rows = config["data"]
+        if is_team:
+            team_names = {**TEAM_NAMES, **config.get("team_names", {})}
+            rows = [(team_names[country], country, pts) for country, pts in rows]
+        for name, country, pts in sorted(rows, key=lambda r: (-r[2], r[0])):
+            names.append(name)
+            countries.append(country)
+            points.append(pts)
+        slices.append((start, len(names), is_team, tuple(config["events"]), config["source"]))
+    # Points are plain ints, so they go in a packed C int array rather than
+    # a tuple of int objects
+    return tuple(names), tuple(countries), array('i', points), tuple(slices)
+
+_NAMES, _COUNTRIES, _POINTS, _SPORT_SLICES = _build_tables()
+
+# Lowercase form of every country code in the data, for id generation
+_COUNTRY_LC = {c: c.lower() for c in set(_COUNTRIES)}
+
+# Lookup table mapping every Latin-1 character except a-z to a dash
+_ID_TRANS = str.maketrans({chr(c): '-' for c in range(256) if not 97 <= c <= 122})
+# Runs of anything but a-z collapse to a single dash in one pass
+_ID_RE = re.compile(r'[^a-z]+')
+
+@lru_cache(maxsize=1024)
 def generate_athlete_id(name, country):
     """Generate a unique athlete ID from name and country."""
-    clean_name = re.sub(r'[^a-z]', '-', name.lower())
-    clean_name = re.sub(r'-+', '-', clean_name).strip('-')
-    return f"{clean_name}-{country.lower()}"
-
+    clean_name = name.lower().translate(_ID_TRANS)
+    if clean_name.isascii():
+        # Split/join collapses dash runs and trims the ends
+        clean_name = '-'.join(filter(None, clean_name.split('-')))
+    else:
+        # Characters beyond Latin-1 are not in the table
+        clean_name = _ID_RE.sub('-', clean_name).strip('-')
+    return f"{clean_name}-{_COUNTRY_LC.get(country) or country.lower()}"
+
+@lru_cache(maxsize=None)
 def generate_team_id(country):
     """Generate a unique team ID from country code."""
-    return f"team-{country.lower()}"
+    return f"team-{_COUNTRY_LC.get(country) or country.lower()}"
+
+def athlete_record(athlete_id, name, country, is_team):
+    """Build the athletes.json record for an athlete or team."""
+    record = {"id": athlete_id, "name": name, "country": country}
+    if is_team:
+        record["type"] = "team"
+    return record
+
+def save_json(data, path):
+    """Write data as 2-space indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2))
+
+def stream_json_array(items, path):
+    """
+    Write an iterable as a JSON array one item at a time.
+    
+    Produces the same 2-space indented layout as save_json without holding
+    the whole list (or its encoded text) in memory. Returns the item count.
+    """
+    count = 0
+    # A 1 MiB buffer lets the whole file go out in a handful of write() calls
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.write(b"[")
+        for item in items:
+            if orjson is not None:
+                data = orjson.dumps(item, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(item, indent=2).encode()
+            f.write(b",\n  " if count else b"\n  ")
+            f.write(data.replace(b"\n", b"\n  "))
+            count += 1
+        f.write(b"\n]" if count else b"]")
+    return count
 
 def main():
-    athletes = []
-    entries = []
-    seen_athletes = set()
-    seen_teams = set()
     source_date = date.today().isoformat()
     
-    for config in SPORT_CONFIG:
-        is_team_event = config.get("type") == "team"
-        
-        for name, country, points in config["data"]:
+    # Pass 1: resolve each standings line to its athlete/team id and collect
+    # the unique athletes (id -> (name, country, is_team), first row wins).
+    athletes_by_id = {}
+    rows = []
+    excluded = EXCLUDED_ATHLETES
+    for start, end, is_team_event, events, source in _SPORT_SLICES:
+        for i in range(start, end):
+            name, country = _NAMES[i], _COUNTRIES[i]
+            
             # Skip excluded athletes (injury, retirement, etc.)
-            if (name, country) in EXCLUDED_ATHLETES:
+            if (name, country) in excluded:
                 print(f"  Excluding: {name} ({country}) - not participating")
                 continue
             
+            # Team events use a team ID instead of an athlete ID
             if is_team_event:
-                # Team event: use team ID instead of athlete ID
-                team_id = generate_team_id(country)
-                
-                # Add team as an "athlete" if not already added
-                if team_id not in seen_teams:
-                    athletes.append({
-                        "id": team_id,
-                        "name": name,
-                        "country": country,
-                        "type": "team"
-                    })
-                    seen_teams.add(team_id)
-                
-                # Add entries for team events
-                for event_id in config["events"]:
-                    entries.append({
-                        "competition_id": event_id,
-                        "athlete_id": team_id,
-                        "score": points,
-                        "source_url": config["source"],
-                        "source_date": source_date
-                    })
+                entry_id = generate_team_id(country)
             else:
-                # Individual event: use athlete ID
-                athlete_id = generate_athlete_id(name, country)
-                
-                # Add athlete if not already added
-                if athlete_id not in seen_athletes:
-                    athletes.append({
-                        "id": athlete_id,
-                        "name": name,
-                        "country": country
-                    })
-                    seen_athletes.add(athlete_id)
-                
-                # Add entries for all relevant events
-                for event_id in config["events"]:
-                    entries.append({
-                        "competition_id": event_id,
-                        "athlete_id": athlete_id,
-                        "score": points,
-                        "source_url": config["source"],
-                        "source_date": source_date
-                    })
+                entry_id = generate_athlete_id(name, country)
+            athletes_by_id.setdefault(entry_id, (name, country, is_team_event))
+            rows.append((entry_id, _POINTS[i], events, source))
+    
+    athletes = [athlete_record(athlete_id, *row) for athlete_id, row in athletes_by_id.items()]
+    
+    # Pass 2: one entry per (standings line, event), no dedup checks needed.
+    # Entries are generated lazily and streamed straight to disk.
+    entries = (
+        {
+            "competition_id": event_id,
+            "athlete_id": entry_id,
+            "score": points,
+            "source_url": source,
+            "source_date": source_date
+        }
+        for entry_id, points, events, source in rows
+        for event_id in events
+    )
     
     # Save athletes
-    with open(DATA_DIR / "athletes.json", "w") as f:
-        json.dump(athletes, f, indent=2)
+    save_json(athletes, DATA_DIR / "athletes.json")
     
     # Save entries  
-    with open(DATA_DIR / "entries.json", "w") as f:
-        json.dump(entries, f, indent=2)
+    num_entries = stream_json_array(entries, DATA_DIR / "entries.json")
     
-    # Print summary
-    individual_athletes = [a for a in athletes if a.get("type") != "team"]
-    team_entries = [a for a in athletes if a.get("type") == "team"]
-    nordic_athletes = [a for a in individual_athletes if a["country"] in NORDIC_COUNTRIES]
-    nordic_teams = [t for t in team_entries if t["country"] in NORDIC_COUNTRIES]
+    # Print summary (one pass groups athletes and teams by country)
+    by_country = defaultdict(list)
+    nordic = NORDIC_COUNTRIES
+    num_teams = 0
+    nordic_teams = 0
+    for a in athletes:
+        by_country[a["country"]].append(a)
+        if a.get("type") == "team":
+            num_teams += 1
+            nordic_teams += a["country"] in nordic
+    nordic_total = sum(len(by_country[c]) for c in nordic)
     
-    print(f"Total individual athletes: {len(individual_athletes)}")
-    print(f"Total team entries: {len(team_entries)}")
-    print(f"Nordic individual athletes: {len(nordic_athletes)}")
-    print(f"Nordic team entries: {len(nordic_teams)}")
-    print(f"Total entries: {len(entries)}")
+    print(f"Total individual athletes: {len(athletes) - num_teams}")
+    print(f"Total team entries: {num_teams}")
+    print(f"Nordic individual athletes: {nordic_total - nordic_teams}")
+    print(f"Nordic team entries: {nordic_teams}")
+    print(f"Total entries: {num_entries}")
     
     print("\nNordic athletes by country:")
-    for country in sorted(NORDIC_COUNTRIES):
-        country_athletes = [a for a in athletes if a["country"] == country]
+    for country in _NORDIC_SORTED:
+        country_athletes = by_country.get(country)
         if country_athletes:
             print(f"\n  {country} ({len(country_athletes)}):")
-            for a in sorted(country_athletes, key=lambda x: x["name"])[:8]:
+            for a in heapq.nsmallest(8, country_athletes, key=itemgetter("name")):
                 print(f"    - {a['name']}")
             if len(country_athletes) > 8:
                 print(f"    ... and {len(country_athletes) - 8} more")
@@ -22,9 +22,12 @@ Mathematical basis:
 
 import random
 import math
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import List, Tuple, Dict, Optional
-from collections import defaultdict
+
+import numpy as np
 
 from model import PlackettLuceModel, AthleteStrength, AthletePrediction
 
@@ -35,6 +38,8 @@ class SimulationConfig:
     num_simulations: int = 10000
     extra_noise_scale: float = 0.0  # Additional noise beyond Plackett-Luce
     seed: Optional[int] = None      # Random seed for reproducibility
+    num_workers: int = 1            # Threads to split simulations over (1 = serial)
+    batch_size: int = 4096          # Simulations per vectorized batch (bounds memory)
 
 
 @dataclass
@@ -85,8 +90,18 @@ class MonteCarloSimulator:
         self.model = model
         self.config = config
         
-        if config.seed is not None:
-            random.seed(config.seed)
+        # The simulator owns its generators instead of reseeding the global
+        # `random` module: a PCG64 NumPy generator for the batched draws in
+        # simulate_competition, and a private Mersenne Twister for the scalar
+        # simulate_once path (same stream random.seed(seed) would give).
+        # Without an explicit seed both are derived from `random`, so
+        # random.seed() still keeps whole runs reproducible. The SeedSequence
+        # is kept so worker generators can be spawned from it
+        # (Generator.spawn needs NumPy >= 1.25).
+        seed = config.seed if config.seed is not None else random.getrandbits(64)
+        self._seed_seq = np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self._seed_seq)
+        self.py_rng = random.Random(seed)
     
     def gumbel_noise(self) -> float:
         """
@@ -96,43 +111,62 @@ class MonteCarloSimulator:
         If X = log(strength) + Gumbel(0,1), then
         P(argmax X = i) = strength_i / sum(strengths)
         """
-        u = random.random()
-        while u == 0:
-            u = random.random()
+        # Map 32 random bits to (r + 1) / (2^32 + 1), which lies strictly
+        # inside (0, 1), so neither log can fail and no retry is needed
+        u = (self.py_rng.getrandbits(32) + 1.0) / 4294967297.0
         return -math.log(-math.log(u))
     
-    def simulate_once(self, athletes: List[AthleteStrength]) -> Tuple[str, str, str]:
+    def simulate_once(self, athlete_ids: List[str], log_strengths: List[float]) -> Tuple[str, str, str]:
         """
         Simulate one competition outcome using Plackett-Luce sampling.
         
-        Method: Add Gumbel(0,1) noise to log(strength), then sort.
-        This gives exact Plackett-Luce probabilities.
-        
-        Optional: Add extra Gaussian noise for more variance.
+        Args:
+            athlete_ids: Athlete IDs, aligned with log_strengths
+            log_strengths: Precomputed log(strength) per athlete
         
         Returns:
             (gold_id, silver_id, bronze_id) - athlete IDs of medal winners
         """
-        noisy_results = []
+        gold, silver, bronze = self._sample_podium(log_strengths)
+        return athlete_ids[gold], athlete_ids[silver], athlete_ids[bronze]
+    
+    def _sample_podium(self, log_strengths: List[float]) -> Tuple[int, int, int]:
+        """
+        Draw one podium and return the medal winners' positions.
+        
+        Method: Add Gumbel(0,1) noise to log(strength) and take the top 3.
+        This gives exact Plackett-Luce probabilities.
+        
+        Optional: Add extra Gaussian noise for more variance.
+        """
+        first = second = third = -math.inf
+        gold = silver = bronze = -1
         
-        for a in athletes:
+        # Bound once so the per-athlete loop does local lookups only
+        gumbel_noise = self.gumbel_noise
+        gauss = self.py_rng.gauss
+        extra_noise_scale = self.config.extra_noise_scale
+        
+        for i, log_strength in enumerate(log_strengths):
             # Plackett-Luce: log(strength) + Gumbel(0,1)
-            log_strength = math.log(max(a.strength, 0.0001))
-            gumbel = self.gumbel_noise()
+            noisy_value = log_strength + gumbel_noise()
             
             # Optional extra noise (for more variance than pure Plackett-Luce)
-            extra_noise = 0.0
-            if self.config.extra_noise_scale > 0:
-                extra_noise = random.gauss(0, self.config.extra_noise_scale)
+            if extra_noise_scale > 0:
+                noisy_value += gauss(0, extra_noise_scale)
             
-            noisy_value = log_strength + gumbel + extra_noise
-            noisy_results.append((noisy_value, a.athlete_id))
-        
-        # Sort by noisy value (descending)
-        noisy_results.sort(key=lambda x: -x[0])
+            # Keep a running top 3 instead of sorting the whole field
+            if noisy_value > first:
+                third, bronze = second, silver
+                second, silver = first, gold
+                first, gold = noisy_value, i
+            elif noisy_value > second:
+                third, bronze = second, silver
+                second, silver = noisy_value, i
+            elif noisy_value > third:
+                third, bronze = noisy_value, i
         
-        # Return top 3 athlete IDs
-        return noisy_results[0][1], noisy_results[1][1], noisy_results[2][1]
+        return gold, silver, bronze
     
     def simulate_competition(self, athletes: List[AthleteStrength]) -> List[SimulatedResult]:
         """
@@ -151,28 +185,25 @@ class MonteCarloSimulator:
         # Ensure strengths are calculated
         athletes = self.model.calculate_strengths(athletes)
         
-        # Get exact predictions from base model
+        # Get exact predictions from base model (aligned with athletes)
         exact_predictions = self.model.predict(athletes)
-        exact_by_id = {p.athlete_id: p for p in exact_predictions}
         
-        # Run simulations
-        medal_counts = defaultdict(lambda: {"gold": 0, "silver": 0, "bronze": 0})
+        # Strengths are clamped so zero scores stay in the race. The sampler
+        # multiplies by 1/strength and works in float32: the model's noise
+        # dwarfs single-precision error, and it halves the memory traffic.
+        inv_strengths = np.array([1.0 / max(a.strength, 0.0001) for a in athletes],
+                                 dtype=np.float32)
         
-        for _ in range(self.config.num_simulations):
-            gold_id, silver_id, bronze_id = self.simulate_once(athletes)
-            medal_counts[gold_id]["gold"] += 1
-            medal_counts[silver_id]["silver"] += 1
-            medal_counts[bronze_id]["bronze"] += 1
+        gold_counts, silver_counts, bronze_counts = self._count_podiums(inv_strengths)
         
         # Build results
         results = []
-        for athlete in athletes:
+        for i, (athlete, exact) in enumerate(zip(athletes, exact_predictions)):
             aid = athlete.athlete_id
-            exact = exact_by_id[aid]
             
-            sim_gold = medal_counts[aid]["gold"] / self.config.num_simulations
-            sim_silver = medal_counts[aid]["silver"] / self.config.num_simulations
-            sim_bronze = medal_counts[aid]["bronze"] / self.config.num_simulations
+            sim_gold = int(gold_counts[i]) / self.config.num_simulations
+            sim_silver = int(silver_counts[i]) / self.config.num_simulations
+            sim_bronze = int(bronze_counts[i]) / self.config.num_simulations
             
             results.append(SimulatedResult(
                 athlete_id=aid,
@@ -188,6 +219,99 @@ class MonteCarloSimulator:
         
         return results
     
+    def _count_podiums(self, inv_strengths: np.ndarray) -> np.ndarray:
+        """
+        Run num_simulations races and count podium finishes.
+        
+        With num_workers > 1 the simulations are split over a thread pool,
+        each chunk drawing from its own independent child generator. The
+        heavy NumPy steps (RNG fills, divide, argpartition) release the GIL,
+        so the chunks run in parallel without pickling anything.
+        
+        Returns:
+            (3, n) array of gold/silver/bronze counts per athlete position
+        """
+        num_sims = self.config.num_simulations
+        workers = min(self.config.num_workers, num_sims)
+        if workers <= 1:
+            return self._simulate_chunk(self.rng, inv_strengths, num_sims)
+        
+        sizes = [num_sims // workers + (i < num_sims % workers) for i in range(workers)]
+        rngs = [np.random.default_rng(s) for s in self._seed_seq.spawn(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return sum(pool.map(self._simulate_chunk, rngs, [inv_strengths] * workers, sizes))
+    
+    def _simulate_chunk(self, rng: np.random.Generator, inv_strengths: np.ndarray,
+                        num_sims: int) -> np.ndarray:
+        """
+        Simulate num_sims races in batches of batch_size and count podiums.
+        
+        Batching keeps the (batch, n_athletes) race matrix small enough to
+        stay in cache through the whole pass instead of streaming a
+        num_sims-sized matrix through memory several times.
+        
+        Each chunk owns its counts histogram, so worker threads never share
+        a tally; _count_podiums reduces the per-chunk histograms at the end.
+        """
+        counts = np.zeros((3, len(inv_strengths)), dtype=np.int64)
+        batch_size = max(self.config.batch_size, 1)
+        for start in range(0, num_sims, batch_size):
+            self._simulate_batch(rng, inv_strengths,
+                                 min(batch_size, num_sims - start), counts)
+        return counts
+    
+    def _simulate_batch(self, rng: np.random.Generator, inv_strengths: np.ndarray,
+                        num_sims: int, counts: np.ndarray) -> None:
+        """
+        Simulate num_sims races at once and add podium finishes to counts.
+        
+        Row = simulation, column = athlete.
+        Gumbel-max without the logs: with E ~ Exp(1), -log(E) is
+        Gumbel(0,1), so log(s) + Gumbel = -log(E / s). Only the ranking
+        matters and log is monotone, so athletes are ranked by the
+        "finish time" E / s, smallest first (an exponential race), and
+        both transcendentals are skipped.
+        """
+        # The float steps below (scaling, log, extra noise) work in place on
+        # the race matrix rather than creating same-sized float temporaries.
+        n = len(inv_strengths)
+        shape = (num_sims, n)
+        times = rng.standard_exponential(size=shape, dtype=np.float32)
+        times *= inv_strengths
+        if self.config.extra_noise_scale > 0:
+            # Extra noise is defined in log space, so move there for it.
+            # Higher log-strength means a lower log-time, hence the minus.
+            with np.errstate(divide="ignore"):
+                np.log(times, out=times)
+            self._subtract_antithetic_normal(rng, times)
+        
+        # Only the podium matters: partition the 3 fastest into the first
+        # three columns per simulation (O(n)), then order just those 3.
+        # Columns 0/1/2 of podiums hold the gold/silver/bronze positions.
+        top3 = np.argpartition(times, 2, axis=1)[:, :3]
+        order = np.argsort(np.take_along_axis(times, top3, axis=1), axis=1)
+        podiums = np.take_along_axis(top3, order, axis=1)
+        # bincount is a buffered histogram (unlike the unbuffered np.add.at
+        # scatter), added straight into the chunk's own (3, n) tally.
+        for k in range(3):
+            counts[k] += np.bincount(podiums[:, k], minlength=n)
+    
+    def _subtract_antithetic_normal(self, rng: np.random.Generator, times: np.ndarray) -> None:
+        """
+        Subtract extra Gaussian noise, drawn as antithetic pairs, from times in place.
+        
+        Only half the rows are sampled; the other half reuses them negated.
+        The noise is symmetric, so the marginal distribution is unchanged,
+        while the paired rows cancel part of the sampling error and halve
+        the RNG work.
+        """
+        num_sims, n = times.shape
+        h = (num_sims + 1) // 2
+        half = rng.standard_normal(size=(h, n), dtype=np.float32)
+        half *= self.config.extra_noise_scale
+        times[:h] -= half
+        times[h:] += half[:num_sims - h]
+    
     def validate_convergence(self, results: List[SimulatedResult], tolerance: float = 0.02) -> Dict:
         """
         Check if simulated probabilities converge to exact model predictions.
@@ -267,7 +391,7 @@ if __name__ == "__main__":
         print(f"\n{'Athlete':<20}{'Exact P(G)':>12}{'Sim P(G)':>12}{'Error':>10}")
         print("-" * 55)
         
-        for r in sorted(results, key=lambda x: -x.exact_gold_prob):
+        for r in sorted(results, key=attrgetter("exact_gold_prob"), reverse=True):
             error_pct = abs(r.sim_gold_prob - r.exact_gold_prob) * 100
             print(f"{r.name:<20}{r.exact_gold_prob*100:>11.1f}%"
                   f"{r.sim_gold_prob*100:>11.1f}%{error_pct:>9.1f}%")
@@ -289,7 +413,7 @@ if __name__ == "__main__":
     print(f"\n{'Athlete':<20}{'Exact P(G)':>12}{'Sim P(G)':>12}{'Diff':>10}")
     print("-" * 55)
     
-    for r in sorted(results, key=lambda x: -x.exact_gold_prob):
+    for r in sorted(results, key=attrgetter("exact_gold_prob"), reverse=True):
         diff = (r.sim_gold_prob - r.exact_gold_prob) * 100
         print(f"{r.name:<20}{r.exact_gold_prob*100:>11.1f}%"
               f"{r.sim_gold_prob*100:>11.1f}%{diff:>+9.1f}%")
@@ -134,6 +134,26 @@ def test_medal_probabilities_consistent():
     print("✓ All medal probabilities are consistent")
 
 
+def test_vectorized_matches_reference():
+    """Vectorized predict should match the per-athlete closed forms."""
+    model = PlackettLuceModel(strength_power=2.0)
+    
+    athletes = create_athletes_from_scores([
+        {"id": str(i), "name": f"Athlete{i}", "country": "X", "score": 100 - i*7 + (i % 3)}
+        for i in range(12)
+    ])
+    
+    predictions = model.predict(athletes)
+    strengths = [a.strength for a in athletes]
+    
+    for i, p in enumerate(predictions):
+        assert abs(p.gold_prob - model._gold_probability(strengths, i)) < 1e-12
+        assert abs(p.silver_prob - model._silver_probability(strengths, i)) < 1e-12
+        assert abs(p.bronze_prob - model._bronze_probability(strengths, i)) < 1e-12
+    
+    print("✓ Vectorized probabilities match the closed forms")
+
+
 def run_all_tests():
     """Run all tests."""
     print("=" * 60)
@@ -147,6 +167,7 @@ def run_all_tests():
     test_equal_scores_equal_probs()
     test_dominant_athlete()
     test_medal_probabilities_consistent()
+    test_vectorized_matches_reference()
     
     print()
     print("=" * 60)
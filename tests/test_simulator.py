@@ -11,17 +11,19 @@ sys.path.insert(0, '..')
 from model import PlackettLuceModel, create_athletes_from_scores
 from simulator import MonteCarloSimulator, SimulationConfig
 
+# Shared three-athlete field, built once for the module. The simulator and
+# model recompute strengths on every call, so reusing it across tests is safe.
+ATHLETES_ABC = create_athletes_from_scores([
+    {"id": "1", "name": "A", "country": "X", "score": 100},
+    {"id": "2", "name": "B", "country": "Y", "score": 80},
+    {"id": "3", "name": "C", "country": "Z", "score": 60},
+])
+
 
 def test_convergence_plackett_luce():
     """Plackett-Luce simulation should converge to exact model predictions."""
     model = PlackettLuceModel(strength_power=2.0)
     
-    athletes = create_athletes_from_scores([
-        {"id": "1", "name": "A", "country": "X", "score": 100},
-        {"id": "2", "name": "B", "country": "Y", "score": 80},
-        {"id": "3", "name": "C", "country": "Z", "score": 60},
-    ])
-    
     config = SimulationConfig(
         num_simulations=50000,
         extra_noise_scale=0.0,  # Pure Plackett-Luce
@@ -29,7 +31,7 @@ def test_convergence_plackett_luce():
     )
     
     simulator = MonteCarloSimulator(model, config)
-    results = simulator.simulate_competition(athletes)
+    results = simulator.simulate_competition(ATHLETES_ABC)
     
     validation = simulator.validate_convergence(results, tolerance=0.02)
     
@@ -39,16 +41,34 @@ def test_convergence_plackett_luce():
     print(f"✓ Plackett-Luce simulation converges (max error: {validation['max_gold_error']:.2%})")
 
 
-def test_more_simulations_better_convergence():
-    """More simulations should give better convergence."""
+def test_silver_bronze_convergence():
+    """Silver and bronze probabilities should also match the exact model."""
     model = PlackettLuceModel(strength_power=2.0)
     
     athletes = create_athletes_from_scores([
         {"id": "1", "name": "A", "country": "X", "score": 100},
         {"id": "2", "name": "B", "country": "Y", "score": 80},
         {"id": "3", "name": "C", "country": "Z", "score": 60},
+        {"id": "4", "name": "D", "country": "W", "score": 40},
     ])
     
+    config = SimulationConfig(num_simulations=50000, extra_noise_scale=0.0, seed=42)
+    simulator = MonteCarloSimulator(model, config)
+    results = simulator.simulate_competition(athletes)
+    
+    for r in results:
+        assert abs(r.sim_silver_prob - r.exact_silver_prob) < 0.02, \
+            f"{r.name} silver: sim {r.sim_silver_prob:.3f} vs exact {r.exact_silver_prob:.3f}"
+        assert abs(r.sim_bronze_prob - r.exact_bronze_prob) < 0.02, \
+            f"{r.name} bronze: sim {r.sim_bronze_prob:.3f} vs exact {r.exact_bronze_prob:.3f}"
+    
+    print("✓ Silver and bronze probabilities converge")
+
+
+def test_more_simulations_better_convergence():
+    """More simulations should give better convergence."""
+    model = PlackettLuceModel(strength_power=2.0)
+    
     errors = []
     for num_sims in [100, 1000, 10000]:
         config = SimulationConfig(
@@ -58,7 +78,7 @@ def test_more_simulations_better_convergence():
         )
         
         simulator = MonteCarloSimulator(model, config)
-        results = simulator.simulate_competition(athletes)
+        results = simulator.simulate_competition(ATHLETES_ABC)
         validation = simulator.validate_convergence(results)
         errors.append((num_sims, validation["max_gold_error"]))
     
@@ -110,23 +130,17 @@ def test_reproducibility_with_seed():
     
     model = PlackettLuceModel(strength_power=2.0)
     
-    athletes = create_athletes_from_scores([
-        {"id": "1", "name": "A", "country": "X", "score": 100},
-        {"id": "2", "name": "B", "country": "Y", "score": 80},
-        {"id": "3", "name": "C", "country": "Z", "score": 60},
-    ])
-    
     # Run 1
     random.seed(12345)
     config1 = SimulationConfig(num_simulations=1000, extra_noise_scale=0.15, seed=None)
     sim1 = MonteCarloSimulator(model, config1)
-    results1 = sim1.simulate_competition(athletes)
+    results1 = sim1.simulate_competition(ATHLETES_ABC)
     
     # Run 2 with same seed
     random.seed(12345)
     config2 = SimulationConfig(num_simulations=1000, extra_noise_scale=0.15, seed=None)
     sim2 = MonteCarloSimulator(model, config2)
-    results2 = sim2.simulate_competition(athletes)
+    results2 = sim2.simulate_competition(ATHLETES_ABC)
     
     for r1, r2 in zip(results1, results2):
         assert r1.sim_gold_prob == r2.sim_gold_prob, \
@@ -135,6 +149,60 @@ def test_reproducibility_with_seed():
     print("✓ Same seed gives reproducible results")
 
 
+def test_parallel_workers():
+    """Splitting simulations over workers should converge and stay seeded."""
+    model = PlackettLuceModel(strength_power=2.0)
+    
+    runs = []
+    for _ in range(2):
+        config = SimulationConfig(num_simulations=50001, seed=7, num_workers=4)
+        simulator = MonteCarloSimulator(model, config)
+        runs.append(simulator.simulate_competition(ATHLETES_ABC))
+    
+    validation = simulator.validate_convergence(runs[0], tolerance=0.02)
+    assert validation["converged"], \
+        f"Parallel simulation should converge. Max error: {validation['max_gold_error']:.2%}"
+    
+    for r1, r2 in zip(*runs):
+        assert r1.sim_gold_prob == r2.sim_gold_prob, "Same seed should give same results"
+    
+    print("✓ Parallel workers converge and are reproducible")
+
+
+def test_simulate_once_converges():
+    """Podiums drawn one at a time should match the exact model for every medal."""
+    import math
+    
+    model = PlackettLuceModel(strength_power=2.0)
+    
+    athletes = model.calculate_strengths(create_athletes_from_scores([
+        {"id": "1", "name": "A", "country": "X", "score": 100},
+        {"id": "2", "name": "B", "country": "Y", "score": 90},
+        {"id": "3", "name": "C", "country": "Z", "score": 75},
+        {"id": "4", "name": "D", "country": "W", "score": 60},
+        {"id": "5", "name": "E", "country": "V", "score": 40},
+    ]))
+    athlete_ids = [a.athlete_id for a in athletes]
+    log_strengths = [math.log(a.strength) for a in athletes]
+    
+    config = SimulationConfig(extra_noise_scale=0.0, seed=42)
+    simulator = MonteCarloSimulator(model, config)
+    
+    num_draws = 40000
+    counts = {aid: [0, 0, 0] for aid in athlete_ids}
+    for _ in range(num_draws):
+        for place, aid in enumerate(simulator.simulate_once(athlete_ids, log_strengths)):
+            counts[aid][place] += 1
+    
+    for p in model.predict(athletes):
+        gold, silver, bronze = (c / num_draws for c in counts[p.athlete_id])
+        assert abs(gold - p.gold_prob) < 0.01, f"{p.name} gold: {gold:.3f} vs {p.gold_prob:.3f}"
+        assert abs(silver - p.silver_prob) < 0.01, f"{p.name} silver: {silver:.3f} vs {p.silver_prob:.3f}"
+        assert abs(bronze - p.bronze_prob) < 0.01, f"{p.name} bronze: {bronze:.3f} vs {p.bronze_prob:.3f}"
+    
+    print("✓ simulate_once podiums converge to the exact model")
+
+
 def test_country_aggregation():
     """Country medal totals should be calculated correctly."""
     model = PlackettLuceModel(strength_power=2.0)
@@ -170,9 +238,12 @@ def run_all_tests():
     print()
     
     test_convergence_plackett_luce()
+    test_silver_bronze_convergence()
     test_more_simulations_better_convergence()
     test_extra_noise_introduces_variance()
     test_reproducibility_with_seed()
+    test_parallel_workers()
+    test_simulate_once_converges()
     test_country_aggregation()
     
     print()